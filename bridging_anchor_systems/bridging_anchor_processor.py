@@ -23,9 +23,75 @@ Key Features:
 - Henry 7 Step 14 Trott Waltz sequencing integration
 """
 
+import functools
+import logging
+import math
 import numpy as np
 import json
-from typing import List, Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy paths are used without it
+    njit = None
+    prange = range
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; plain NumPy ufuncs are used without it
+    ne = None
+
+# Tunable heuristic: numexpr's dispatch overhead only pays off on large
+# buffers, so smaller ones use plain NumPy ufuncs. Where numexpr starts to win
+# depends on the host and its thread count; adjust this to suit
+_NUMEXPR_MIN_SIZE = 1 << 18
+
+
+def _quantum_modulator_py(depth, levels, baseline, out):
+    """Fill out with the normalized quantum modulator, one sample per iteration."""
+    n = out.shape[0]
+    steps = min(depth, levels)
+    norm = 1.0 + depth * baseline
+    for i in prange(n):
+        acc = 0.0
+        for k in range(steps):
+            acc += math.sin(i * (2.0 * math.pi * k / levels) / n) * baseline / (k + 1)
+        out[i] = (1.0 + acc) / norm
+    return out
+
+
+if njit is not None:
+    _quantum_kernel = njit(parallel=True, fastmath=True, cache=True)(_quantum_modulator_py)
+else:
+    _quantum_kernel = None
+
+
+# Ahead-of-time compiled kernels from build_aot.py, free of JIT warmup
+try:
+    import ba_kernels
+    _AOT_QUANTUM_KERNELS = {
+        np.dtype(np.float64): ba_kernels.quantum_modulator,
+        np.dtype(np.float32): ba_kernels.quantum_modulator_f32,
+    }
+except (ImportError, AttributeError):  # not built, or built from an older build_aot.py
+    _AOT_QUANTUM_KERNELS = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _henry_sequence(node_id: int, base: int, square: int, length: int) -> np.ndarray:
+    """Return the read-only Henry framework sequence for a node."""
+    sequence = []
+    current = node_id
+    for _ in range(length):
+        sequence.append(current)
+        current = (current * base) % square
+    # Let NumPy infer the dtype so a float node_id is not truncated
+    sequence = np.array(sequence)
+    sequence.flags.writeable = False
+    return sequence
+
 
 class BridgingAnchorProcessor:
     """
@@ -35,12 +101,14 @@ class BridgingAnchorProcessor:
     bridging techniques for signal transformation and anchor points for stability.
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, dtype=np.float64):
         """
         Initialize the Bridging Anchor Processor.
         
         Args:
             config_path: Optional path to configuration file
+            dtype: Working sample dtype; np.float32 halves memory traffic and is
+                lossless for sources up to 24 precision bits
         """
         # Base ratio (anchor ratio for mathematical harmony)
         self.base_ratio = 1.618033988749
@@ -64,44 +132,131 @@ class BridgingAnchorProcessor:
         self.sample_rate = 44100
         self.precision_bits = 16
         self.spatial_resolution = 'high'
+        self.dtype = np.dtype(dtype)
+        
+        # Input-independent lookup tables reused across calls; each key holds
+        # every attribute the table depends on, so changing one rebuilds it
+        self._cache_size = 32
+        self._mod_cache: Dict[Tuple, np.ndarray] = {}
+        self._quantum_cache: Dict[Tuple, np.ndarray] = {}
+        self._henry_factor_cache: Dict[Tuple, np.ndarray] = {}
         
-        print(f"🌉 Bridging Anchor Processor initialized")
-        print(f"📊 Base Ratio: {self.base_ratio}")
-        print(f"⚓ Bridging Baseline: {self.bridging_baseline}")
-        print(f"🎵 Henry 7 Step 14 Framework: {self.henry_base} → {self.henry_double} → {self.henry_square}")
+        logger.debug("Bridging Anchor Processor initialized: base ratio %s, bridging baseline %s, "
+                     "Henry 7 Step 14 framework %s → %s → %s",
+                     self.base_ratio, self.bridging_baseline,
+                     self.henry_base, self.henry_double, self.henry_square)
     
     def load_config(self, config_path: str):
         """Load configuration from JSON file."""
         try:
             with open(config_path, 'r') as f:
-                config = json.load(f)
+                config = json.loads(f.read())
                 self.sample_rate = config.get('sample_rate', self.sample_rate)
                 self.precision_bits = config.get('precision', self.precision_bits)
                 self.spatial_resolution = config.get('spatial_resolution', self.spatial_resolution)
         except Exception as e:
-            print(f"⚠️ Could not load config: {e}")
+            logger.warning("Could not load config: %s", e)
+    
+    def _cache_store(self, cache: Dict, key, value: np.ndarray) -> np.ndarray:
+        """Store a read-only table in a cache, evicting the oldest entry when full."""
+        if len(cache) >= self._cache_size:
+            del cache[next(iter(cache))]
+        value.flags.writeable = False
+        cache[key] = value
+        return value
+    
+    def _working_dtype(self, signal: np.ndarray) -> np.dtype:
+        """Return the dtype the stages compute in, keeping complex input complex."""
+        if np.iscomplexobj(signal):
+            return np.result_type(self.dtype, np.complex64)
+        return self.dtype
+    
+    def _henry_modulation(self, length: int) -> np.ndarray:
+        """Return the Henry 7 Step 14 modulation sine for a signal length."""
+        key = (length, self.henry_base, self.dtype)
+        modulation = self._mod_cache.get(key)
+        if modulation is None:
+            modulation = np.sin(np.arange(length) * 2 * np.pi * self.henry_base / length).astype(self.dtype)
+            modulation = self._cache_store(self._mod_cache, key, modulation)
+        return modulation
+    
+    def _quantum_modulator(self, length: int, depth: int) -> np.ndarray:
+        """Return the normalized quantum tunneling modulator for a signal length and depth."""
+        key = (length, depth, self.quantum_recursion_levels, self.bridging_baseline, self.dtype)
+        modulator = self._quantum_cache.get(key)
+        if modulator is not None:
+            return modulator
+        
+        # Prefer the AOT build, then the JIT kernel, then plain NumPy
+        kernel = _AOT_QUANTUM_KERNELS.get(self.dtype, _quantum_kernel)
+        if kernel is not None:
+            modulator = kernel(depth, self.quantum_recursion_levels, self.bridging_baseline,
+                               np.empty(length, dtype=self.dtype))
+        else:
+            # Stack every recursion level's quantum wave into one L x N matrix
+            # and collapse the weighted sum with a single GEMV
+            levels = min(depth, self.quantum_recursion_levels)
+            k = np.arange(levels, dtype=np.float64)
+            phases = 2 * np.pi * k / self.quantum_recursion_levels
+            quantum_waves = np.sin(np.outer(phases / length, np.arange(length, dtype=np.float64)))
+            modulator = (self.bridging_baseline / (k + 1)) @ quantum_waves
+            modulator += 1
+            modulator /= 1 + depth * self.bridging_baseline
+            modulator = modulator.astype(self.dtype, copy=False)
+        
+        return self._cache_store(self._quantum_cache, key, modulator)
     
-    def apply_bridging_transform(self, signal: np.ndarray, intensity: float = 1.0) -> np.ndarray:
+    def _henry_factors(self, length: int, node_id: int) -> np.ndarray:
+        """Return the per-sample Henry sequence factors for a signal length and node."""
+        key = (length, node_id, self.henry_base, self.henry_square, self.henry_double,
+               self.base_ratio, self.dtype)
+        factor_vec = self._henry_factor_cache.get(key)
+        if factor_vec is None:
+            # Create sequence based on Henry framework
+            sequence = _henry_sequence(node_id, self.henry_base, self.henry_square, self.henry_double)
+            
+            # Spread one factor per sequence step over equal chunks, with the
+            # last chunk taking the remainder
+            factors = ((sequence / self.henry_square) * self.base_ratio).astype(self.dtype)
+            counts = np.full(len(sequence), length // len(sequence))
+            counts[-1] += length - counts.sum()
+            factor_vec = self._cache_store(self._henry_factor_cache, key, np.repeat(factors, counts))
+        return factor_vec
+    
+    def apply_bridging_transform(self, signal: np.ndarray, intensity: float = 1.0,
+                                 out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply bridging transformation to signal using base ratio calculations.
         
         Args:
             signal: Input signal array
             intensity: Transform intensity (0.0-1.0)
+            out: Optional preallocated output buffer (may be signal itself)
             
         Returns:
             Transformed signal with bridging applied
         """
+        signal = signal.astype(self._working_dtype(signal), copy=False)
+        modulation = self._henry_modulation(signal.shape[-1])
+        gain = self.dtype.type(1 + self.bridging_baseline * intensity)
+        mod_scale = self.dtype.type(0.1 * intensity)
+        
+        # Fuse base ratio bridging and Henry 7 Step 14 modulation into one
+        # cache-blocked pass when numexpr is available and the buffer is large
+        if ne is not None and signal.size >= _NUMEXPR_MIN_SIZE:
+            return ne.evaluate("signal * gain + modulation * mod_scale", out=out, casting='same_kind',
+                               local_dict={'signal': signal, 'gain': gain,
+                                           'modulation': modulation, 'mod_scale': mod_scale})
+        
         # Apply base ratio bridging
-        bridged = signal * (1 + self.bridging_baseline * intensity)
+        bridged = np.multiply(signal, gain, out=out)
         
         # Apply Henry 7 Step 14 modulation
-        modulation = np.sin(np.arange(len(signal)) * 2 * np.pi * self.henry_base / len(signal))
-        bridged = bridged + modulation * 0.1 * intensity
+        bridged += modulation * mod_scale
         
         return bridged
     
-    def detect_anchor_points(self, signal: np.ndarray, threshold: float = 0.7) -> List[int]:
+    def detect_anchor_points(self, signal: np.ndarray, threshold: float = 0.7) -> np.ndarray:
         """
         Detect anchor points in the signal for stabilization.
         
@@ -110,40 +265,72 @@ class BridgingAnchorProcessor:
             threshold: Detection threshold (0.0-1.0)
             
         Returns:
-            List of anchor point indices
+            Array of anchor point indices
         """
-        # Find peaks that exceed threshold
-        signal_normalized = np.abs(signal) / (np.max(np.abs(signal)) + 1e-10)
-        anchor_points = np.where(signal_normalized > threshold)[0]
+        # Compare squared magnitudes so no abs/normalize pass is needed
+        if np.iscomplexobj(signal):
+            power = signal.real * signal.real + signal.imag * signal.imag
+        else:
+            # Square in the working float dtype; integer PCM would overflow
+            signal = signal.astype(self.dtype, copy=False)
+            power = signal * signal
+        height = (threshold * threshold) * power.max(initial=0)
+        
+        # Keep only local maxima above threshold, one anchor per peak rather
+        # than every sample of its neighbourhood (first sample of a plateau).
+        # Padding with -inf lets the first and last samples count as peaks.
+        padded = np.concatenate(([-np.inf], power, [-np.inf]))
+        peaks = (power > padded[:-2]) & (power >= padded[2:]) & (power > height)
+        anchor_points = np.flatnonzero(peaks)
         
-        return anchor_points.tolist()
+        return anchor_points
     
-    def stabilize_at_anchors(self, signal: np.ndarray, anchor_points: List[int]) -> np.ndarray:
+    def stabilize_at_anchors(self, signal: np.ndarray, anchor_points: np.ndarray,
+                             copy: bool = True) -> np.ndarray:
         """
         Stabilize signal at detected anchor points.
         
         Args:
             signal: Input signal array
-            anchor_points: List of anchor point indices
+            anchor_points: Array of anchor point indices
+            copy: When False, scale signal in place instead of a copy; signal
+                must then already be in the working dtype
             
         Returns:
             Stabilized signal
-        """
-        stabilized = signal.copy()
-        
-        # Apply stabilization around each anchor point
-        for anchor in anchor_points:
-            # Define stabilization window
-            window_size = self.henry_double
-            start = max(0, anchor - window_size)
-            end = min(len(signal), anchor + window_size)
             
-            # Apply bridging baseline stabilization
-            stabilized[start:end] *= self.bridging_baseline
+        Raises:
+            TypeError: If copy is False and signal would need a dtype cast
+        """
+        dtype = self._working_dtype(signal)
+        if not copy and signal.dtype != dtype:
+            raise TypeError(
+                f"in-place stabilization needs a {dtype} signal, got {signal.dtype}"
+            )
+        signal = signal.astype(dtype, copy=False)
+        length = len(signal)
+        
+        # Define stabilization window around each anchor point
+        window_size = self.henry_double
+        anchors = np.asarray(anchor_points, dtype=np.int64)
+        starts = np.clip(anchors - window_size, 0, length)
+        ends = np.clip(anchors + window_size, 0, length)
+        
+        # Count the windows covering each sample from a difference array, so
+        # overlapping windows compound the baseline just like repeated scaling
+        edges = (np.bincount(starts, minlength=length + 1)[:length]
+                 - np.bincount(ends, minlength=length + 1)[:length])
+        coverage = np.cumsum(edges)
+        covered = np.flatnonzero(coverage)
+        
+        # Apply bridging baseline stabilization
+        stabilized = signal.copy() if copy else signal
+        stabilized[covered] *= self.bridging_baseline ** coverage[covered]
         
         return stabilized
     
-    def apply_quantum_tunneling(self, signal: np.ndarray, depth: Optional[int] = None) -> np.ndarray:
+    def apply_quantum_tunneling(self, signal: np.ndarray, depth: Optional[int] = None,
+                                out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply quantum tunneling effect for enhanced processing.
         
@@ -152,6 +339,7 @@ class BridgingAnchorProcessor:
         Args:
             signal: Input signal array
             depth: Quantum depth (default: self.quantum_depth)
+            out: Optional preallocated output buffer (may be signal itself)
             
         Returns:
             Signal with quantum tunneling applied
@@ -159,52 +347,36 @@ class BridgingAnchorProcessor:
         if depth is None:
             depth = self.quantum_depth
         
-        result = signal.copy()
-        
-        # Apply recursive quantum transformations
-        for level in range(min(depth, self.quantum_recursion_levels)):
-            phase = 2 * np.pi * level / self.quantum_recursion_levels
-            quantum_wave = np.sin(np.arange(len(signal)) * phase / len(signal))
-            result += signal * quantum_wave * (self.bridging_baseline / (level + 1))
+        signal = signal.astype(self._working_dtype(signal), copy=False)
         
-        # Normalize to prevent overflow
-        result = result / (1 + depth * self.bridging_baseline)
+        # The recursive quantum transformations only modulate the signal, so the
+        # (normalized) modulator is input-independent and cached per length
+        modulator = self._quantum_modulator(signal.shape[-1], depth)
         
-        return result
+        return np.multiply(signal, modulator, out=out)
     
-    def process_with_henry_sequence(self, signal: np.ndarray, node_id: int = 7) -> np.ndarray:
+    def process_with_henry_sequence(self, signal: np.ndarray, node_id: int = 7,
+                                    out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Process signal using Henry 7 Step 14 Trott Waltz sequence methodology.
         
         Args:
             signal: Input signal array
             node_id: Node identifier for sequencing (default: 7)
+            out: Optional preallocated output buffer (may be signal itself)
             
         Returns:
             Processed signal
         """
+        signal = signal.astype(self._working_dtype(signal), copy=False)
+        
         # Apply node-specific transformation
         node_factor = node_id / self.henry_base
         
-        # Create sequence based on Henry framework
-        sequence = []
-        current = node_id
-        for _ in range(self.henry_double):
-            sequence.append(current)
-            current = (current * self.henry_base) % self.henry_square
-        
-        # Apply sequence transformation
-        result = signal.copy()
-        chunk_size = len(signal) // len(sequence)
-        
-        for i, seq_val in enumerate(sequence):
-            start = i * chunk_size
-            end = start + chunk_size if i < len(sequence) - 1 else len(signal)
-            if start < len(signal):
-                factor = (seq_val / self.henry_square) * self.base_ratio
-                result[start:end] *= factor
-        
-        return result
+        # Apply sequence transformation in one multiply
+        factor_vec = self._henry_factors(signal.shape[-1], node_id)
+        
+        return np.multiply(signal, factor_vec, out=out)
     
     def full_bridging_anchor_process(self, signal: np.ndarray, 
                                      apply_quantum: bool = True,
@@ -220,19 +392,63 @@ class BridgingAnchorProcessor:
         Returns:
             Dictionary containing processed signals at each stage
         """
+        if signal.ndim != 1:
+            raise ValueError(
+                f"signal must be a 1-D array, got shape {signal.shape}; "
+                "use full_bridging_anchor_process_batch for batches"
+            )
+        return self._run_pipeline(signal, apply_quantum, node_id, batched=False)
+    
+    def full_bridging_anchor_process_batch(self, signals: np.ndarray,
+                                           apply_quantum: bool = True,
+                                           node_id: int = 7) -> Dict[str, object]:
+        """
+        Run the processing pipeline over a batch of equal-length signals.
+        
+        The bridging, quantum tunneling and Henry sequence stages broadcast
+        their lookup tables across the batch in one vectorized call; anchor
+        detection and stabilization still run per row.
+        
+        Args:
+            signals: Input array of shape (batch, samples)
+            apply_quantum: Whether to apply quantum tunneling
+            node_id: Node ID for Henry sequencing
+            
+        Returns:
+            Dictionary containing (batch, samples) arrays for each stage, with
+            'anchor_points' holding one index array per row
+        """
+        if signals.ndim != 2:
+            raise ValueError(
+                f"signals must be a 2-D (batch, samples) array, got shape {signals.shape}"
+            )
+        return self._run_pipeline(signals, apply_quantum, node_id, batched=True)
+    
+    def _run_pipeline(self, signal: np.ndarray, apply_quantum: bool,
+                      node_id: int, batched: bool) -> Dict[str, object]:
+        """Run the pipeline stages on one signal or, if batched, on each row."""
+        # Expose the input through a read-only view rather than a full copy
+        original = signal.view()
+        original.flags.writeable = False
         results = {
-            'original': signal.copy()
+            'original': original
         }
         
         # Step 1: Apply bridging transformation
         bridged = self.apply_bridging_transform(signal)
         results['bridged'] = bridged
         
-        # Step 2: Detect and stabilize anchor points
-        anchors = self.detect_anchor_points(bridged)
-        stabilized = self.stabilize_at_anchors(bridged, anchors)
+        # Step 2: Detect and stabilize anchor points, row by row for a batch
+        if batched:
+            anchors = [self.detect_anchor_points(row) for row in bridged]
+            stabilized = bridged.copy()
+            for row, row_anchors in zip(stabilized, anchors):
+                self.stabilize_at_anchors(row, row_anchors, copy=False)
+        else:
+            anchors = self.detect_anchor_points(bridged)
+            stabilized = self.stabilize_at_anchors(bridged, anchors)
         results['stabilized'] = stabilized
-        results['anchor_points'] = np.array(anchors)
+        results['anchor_points'] = anchors
         
         # Step 3: Apply quantum tunneling if requested
         if apply_quantum:
@@ -14,6 +14,8 @@ quantum tunneling, and Henry 7 Step 14 Trott Waltz sequencing.
 
 import sys
 import os
+import functools
+import warnings
 import numpy as np
 import json
 from typing import Dict, List
@@ -22,12 +24,21 @@ from typing import Dict, List
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
+    import bridging_anchor_processor
     from bridging_anchor_processor import BridgingAnchorProcessor
 except ImportError:
     print("⚠️ Could not import BridgingAnchorProcessor")
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _sine_signal(n_samples: int, freq: float, sample_rate: float) -> np.ndarray:
+    """Shared read-only sine fixture; call .copy() before mutating it."""
+    signal = np.sin(2 * np.pi * freq * np.arange(n_samples) / sample_rate)
+    signal.flags.writeable = False
+    return signal
+
+
 class BridgingAnchorTestSuite:
     """Comprehensive test suite for Bridging Anchor Processor."""
     
@@ -109,6 +120,30 @@ class BridgingAnchorTestSuite:
         assert 100 in anchors, "Expected anchor at index 100"
         assert 500 in anchors, "Expected anchor at index 500"
         assert 900 in anchors, "Expected anchor at index 900"
+        
+        # Integer PCM must not overflow when squared
+        pcm = (30000 * _sine_signal(1000, 5.0, 1000)).astype(np.int16)
+        pcm_anchors = self.processor.detect_anchor_points(pcm, threshold=0.5)
+        float_anchors = self.processor.detect_anchor_points(pcm.astype(np.float64), threshold=0.5)
+        assert np.array_equal(pcm_anchors, float_anchors), "int16 input detected different anchors"
+    
+    def test_anchor_peak_semantics(self):
+        """Test that anchors are local maxima: one per crest, plateau and edge."""
+        # A smooth sine yields one anchor per crest of its magnitude
+        anchors = self.processor.detect_anchor_points(_sine_signal(1000, 5.0, 1000), threshold=0.7)
+        assert np.array_equal(anchors, np.arange(50, 1000, 100)), f"Expected one anchor per crest, got {anchors}"
+        
+        # A flat-topped peak yields a single anchor at its first sample
+        plateau = np.array([0.0, 0.2, 1.0, 1.0, 1.0, 0.2, 0.0])
+        anchors = self.processor.detect_anchor_points(plateau, threshold=0.5)
+        assert np.array_equal(anchors, [2]), f"Expected one plateau anchor, got {anchors}"
+        
+        # Peaks at the first and last samples are anchors
+        edges = np.zeros(10)
+        edges[0] = 1.0
+        edges[-1] = 1.0
+        anchors = self.processor.detect_anchor_points(edges, threshold=0.5)
+        assert np.array_equal(anchors, [0, 9]), f"Expected edge anchors, got {anchors}"
     
     def test_stabilization(self):
         """Test anchor stabilization."""
@@ -122,11 +157,28 @@ class BridgingAnchorTestSuite:
         assert len(result) == len(signal), "Output length mismatch"
         assert not np.array_equal(result, signal), "Stabilization had no effect"
         assert np.isfinite(result).all(), "Stabilization produced invalid values"
+        
+        # copy=False scales a working-dtype buffer in place
+        buffer = signal.copy()
+        in_place = self.processor.stabilize_at_anchors(buffer, anchor_points, copy=False)
+        assert in_place is buffer, "copy=False did not return the input buffer"
+        assert np.array_equal(buffer, result), "In-place stabilization mismatch"
+        
+        # ...and refuses buffers it could only stabilize through a cast copy
+        for dtype in (np.float32, np.int16):
+            buffer = np.ones(100, dtype=dtype)
+            try:
+                self.processor.stabilize_at_anchors(buffer, [50], copy=False)
+            except TypeError:
+                pass
+            else:
+                raise AssertionError(f"copy=False accepted a {np.dtype(dtype)} buffer")
+            assert buffer[50] == 1, f"{np.dtype(dtype)} buffer was modified"
     
     def test_quantum_tunneling(self):
         """Test quantum tunneling effect."""
         # Create test signal
-        signal = np.sin(2 * np.pi * np.linspace(0, 1, 1000))
+        signal = _sine_signal(1000, 1.0, 1000)
         
         # Apply quantum tunneling
         result = self.processor.apply_quantum_tunneling(signal, depth=14)
@@ -140,6 +192,31 @@ class BridgingAnchorTestSuite:
         
         assert not np.array_equal(result_shallow, result_deep), "Depth parameter has no effect"
     
+    def test_quantum_numpy_fallback(self):
+        """Test the NumPy quantum modulator against the compiled kernel path."""
+        signal = _sine_signal(1000, 1.0, 1000)
+        
+        for dtype, rtol in ((np.float64, 1e-10), (np.float32, 1e-5)):
+            kernel_processor = BridgingAnchorProcessor(dtype=dtype)
+            expected = {depth: kernel_processor.apply_quantum_tunneling(signal, depth=depth)
+                        for depth in (7, 14, 21)}
+            
+            # Hide the JIT and AOT kernels so a fresh processor takes the NumPy path
+            saved = (bridging_anchor_processor._quantum_kernel,
+                     bridging_anchor_processor._AOT_QUANTUM_KERNELS)
+            bridging_anchor_processor._quantum_kernel = None
+            bridging_anchor_processor._AOT_QUANTUM_KERNELS = {}
+            try:
+                numpy_processor = BridgingAnchorProcessor(dtype=dtype)
+                for depth, kernel_result in expected.items():
+                    result = numpy_processor.apply_quantum_tunneling(signal, depth=depth)
+                    assert result.dtype == kernel_result.dtype, f"dtype mismatch at depth {depth}"
+                    assert np.allclose(result, kernel_result, rtol=rtol, atol=rtol), \
+                        f"NumPy fallback diverges at depth {depth} ({np.dtype(dtype)})"
+            finally:
+                (bridging_anchor_processor._quantum_kernel,
+                 bridging_anchor_processor._AOT_QUANTUM_KERNELS) = saved
+    
     def test_henry_sequence_processing(self):
         """Test Henry 7 Step 14 Trott Waltz sequence processing."""
         # Create test signal
@@ -153,14 +230,52 @@ class BridgingAnchorTestSuite:
         assert len(result_14) == len(signal), "Output length mismatch"
         assert not np.array_equal(result_7, result_14), "Node ID has no effect"
         assert np.isfinite(result_7).all(), "Processing produced invalid values"
+        
+        # A fractional node ID is used as-is, not truncated to an integer
+        result_frac = self.processor.process_with_henry_sequence(signal, node_id=7.5)
+        assert not np.array_equal(result_frac, result_7), "Fractional node ID was truncated"
+        assert np.isclose(result_frac[0], 7.5 / 49 * self.processor.base_ratio), \
+            "Fractional node ID factor mismatch"
+    
+    def test_out_buffers(self):
+        """Test the out= contract of the elementwise stages."""
+        signal = _sine_signal(1000, 440.0, 44100)
+        stages = {
+            'bridging': self.processor.apply_bridging_transform,
+            'quantum': self.processor.apply_quantum_tunneling,
+            'henry': self.processor.process_with_henry_sequence,
+        }
+        
+        for name, stage in stages.items():
+            expected = stage(signal)
+            
+            # A provided buffer is filled and returned as the same object
+            out = np.empty_like(expected)
+            result = stage(signal, out=out)
+            assert result is out, f"{name} did not return the out buffer"
+            assert np.array_equal(out, expected), f"{name} out buffer mismatch"
+            
+            # The buffer may alias the input signal
+            aliased = signal.copy()
+            result = stage(aliased, out=aliased)
+            assert result is aliased, f"{name} did not return the aliased buffer"
+            assert np.allclose(aliased, expected), f"{name} aliased result mismatch"
+            
+            # Integer input and a narrower float32 buffer are cast as needed
+            narrow = np.empty(signal.shape, dtype=np.float32)
+            result = stage(signal, out=narrow)
+            assert result is narrow and narrow.dtype == np.float32, f"{name} changed the out dtype"
+            assert np.allclose(narrow, expected, rtol=1e-5, atol=1e-6), f"{name} float32 out mismatch"
+            pcm = (1000 * signal).astype(np.int16)
+            assert np.allclose(stage(pcm, out=np.empty(signal.shape)), stage(pcm.astype(np.float64))), \
+                f"{name} int16 input mismatch"
     
     def test_full_pipeline(self):
         """Test complete bridging anchor processing pipeline."""
         # Create test signal
         duration = 0.1
         sample_rate = 44100
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        signal = np.sin(2 * np.pi * 440 * t)
+        signal = _sine_signal(int(sample_rate * duration), 440.0, sample_rate)
         
         # Run full pipeline
         results = self.processor.full_bridging_anchor_process(signal, apply_quantum=True, node_id=7)
@@ -177,6 +292,106 @@ class BridgingAnchorTestSuite:
         for key, value in results.items():
             if key != 'anchor_points':
                 assert len(value) == len(signal), f"Length mismatch in {key}"
+        
+        # Original is a read-only view that aliases the caller's array
+        writable = signal.copy()
+        original = self.processor.full_bridging_anchor_process(writable)['original']
+        assert np.shares_memory(original, writable), "Original does not alias the input"
+        assert not original.flags.writeable, "Original should be read-only"
+        assert writable.flags.writeable, "Caller's array should stay writable"
+        writable[0] = 123.0
+        assert original[0] == 123.0, "Original should reflect the caller's array"
+        
+        # Batches go through the batch entry point
+        try:
+            self.processor.full_bridging_anchor_process(np.stack([signal, signal]))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Single-signal pipeline accepted a 2-D array")
+    
+    def test_batch_pipeline(self):
+        """Test batched pipeline against per-signal processing."""
+        # Create a batch of test signals
+        signals = np.stack([
+            _sine_signal(1000, freq, 44100) for freq in (220.0, 440.0, 880.0)
+        ])
+        
+        # Run batched and per-signal pipelines
+        batch = self.processor.full_bridging_anchor_process_batch(signals, apply_quantum=True, node_id=7)
+        
+        assert batch['final'].shape == signals.shape, "Batch shape mismatch"
+        assert len(batch['anchor_points']) == len(signals), "Anchor rows mismatch"
+        for i, signal in enumerate(signals):
+            single = self.processor.full_bridging_anchor_process(signal, apply_quantum=True, node_id=7)
+            assert np.allclose(batch['final'][i], single['final']), f"Row {i} differs from single pipeline"
+            assert np.array_equal(batch['anchor_points'][i], single['anchor_points']), f"Row {i} anchors differ"
+        
+        # Anything but a 2-D batch is rejected up front
+        for bad in (signals[0], signals[None]):
+            try:
+                self.processor.full_bridging_anchor_process_batch(bad)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"Batch pipeline accepted shape {bad.shape}")
+    
+    def test_float32_pipeline(self):
+        """Test the float32 fast path against the float64 pipeline."""
+        signal = _sine_signal(4410, 440.0, 44100)
+        processor_32 = BridgingAnchorProcessor(dtype=np.float32)
+        
+        results_32 = processor_32.full_bridging_anchor_process(signal.astype(np.float32))
+        results_64 = self.processor.full_bridging_anchor_process(signal)
+        
+        for stage in ('bridged', 'stabilized', 'quantum', 'final'):
+            assert results_32[stage].dtype == np.float32, f"{stage} not float32"
+            assert np.allclose(results_32[stage], results_64[stage], rtol=1e-5, atol=1e-6), \
+                f"{stage} differs from float64 beyond float32 tolerance"
+    
+    def test_complex_pipeline(self):
+        """Test that complex signals keep their imaginary part end to end."""
+        real = _sine_signal(1000, 5.0, 1000)
+        imag = _sine_signal(1000, 3.0, 1000)
+        signal = real + 1j * imag
+        
+        # Casting to a real dtype would raise ComplexWarning
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            results = self.processor.full_bridging_anchor_process(signal)
+        for stage in ('bridged', 'stabilized', 'quantum', 'final'):
+            assert np.iscomplexobj(results[stage]), f"{stage} dropped the imaginary part"
+        
+        # Anchors follow the complex magnitude of the bridged signal
+        magnitude = np.abs(results['bridged'])
+        assert np.array_equal(results['anchor_points'], self.processor.detect_anchor_points(magnitude)), \
+            "Complex anchors do not follow the magnitude"
+        
+        # The multiplicative stages act on both parts independently
+        for stage in (self.processor.apply_quantum_tunneling, self.processor.process_with_henry_sequence):
+            result = stage(signal)
+            assert np.allclose(result.real, stage(real)), "Real part mismatch"
+            assert np.allclose(result.imag, stage(imag)), "Imaginary part mismatch"
+    
+    def test_cache_invalidation(self):
+        """Test that lookup tables are rebuilt when processor attributes change."""
+        signal = _sine_signal(1000, 440.0, 44100)
+        warmed = BridgingAnchorProcessor()
+        warmed.full_bridging_anchor_process(signal)
+        fresh = BridgingAnchorProcessor()
+        
+        # Change every attribute the cached tables depend on
+        for processor in (warmed, fresh):
+            processor.henry_base = 3
+            processor.henry_square = 25
+            processor.quantum_recursion_levels = 7
+            processor.bridging_baseline = 0.5
+            processor.base_ratio = 1.5
+        
+        warmed_results = warmed.full_bridging_anchor_process(signal)
+        fresh_results = fresh.full_bridging_anchor_process(signal)
+        for stage in ('bridged', 'quantum', 'final'):
+            assert np.allclose(warmed_results[stage], fresh_results[stage]), f"Stale cache used for {stage}"
     
     def test_base_ratio_calculations(self):
         """Test base ratio and bridging baseline calculations."""
@@ -216,10 +431,17 @@ class BridgingAnchorTestSuite:
         self.run_test("Processor Initialization", self.test_initialization)
         self.run_test("Bridging Transform", self.test_bridging_transform)
         self.run_test("Anchor Point Detection", self.test_anchor_detection)
+        self.run_test("Anchor Peak Semantics", self.test_anchor_peak_semantics)
         self.run_test("Anchor Stabilization", self.test_stabilization)
         self.run_test("Quantum Tunneling", self.test_quantum_tunneling)
+        self.run_test("Quantum NumPy Fallback", self.test_quantum_numpy_fallback)
         self.run_test("Henry Sequence Processing", self.test_henry_sequence_processing)
+        self.run_test("Output Buffers", self.test_out_buffers)
         self.run_test("Full Processing Pipeline", self.test_full_pipeline)
+        self.run_test("Batch Processing Pipeline", self.test_batch_pipeline)
+        self.run_test("Float32 Pipeline", self.test_float32_pipeline)
+        self.run_test("Complex Pipeline", self.test_complex_pipeline)
+        self.run_test("Cache Invalidation", self.test_cache_invalidation)
         self.run_test("Base Ratio Calculations", self.test_base_ratio_calculations)
         self.run_test("Configuration Loading", self.test_config_loading)
         self.run_test("Henry Framework Constants", self.test_henry_framework_constants)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Bridging Anchor AOT Kernel Builder
+==================================
+
+TRADEMARK INFORMATION:
+Owner: Scott Charles Olson
+Trademark: TRADEMARKED BY SCOTT CHARLES OLSON
+
+Compiles the hot Bridging Anchor Processor kernels ahead of time with
+numba.pycc into a `ba_kernels` extension module next to this file. The
+processor imports it when present, skipping JIT warmup; rebuild it after
+editing the kernel.
+
+numba.pycc is pending deprecation upstream (importing it warns on recent
+Numba releases).
+
+Usage:
+    python3 build_aot.py
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bridging_anchor_processor import _quantum_modulator_py
+
+cc = CC('ba_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same source as the JIT kernel; prange compiles as a serial range under pycc
+cc.export('quantum_modulator', 'f8[:](i8, i8, f8, f8[:])')(_quantum_modulator_py)
+cc.export('quantum_modulator_f32', 'f4[:](i8, i8, f8, f4[:])')(_quantum_modulator_py)
+
+
+if __name__ == "__main__":
+    cc.compile()